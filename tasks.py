@@ -1,7 +1,21 @@
-import argparse
 import json
 import os
+import re
+import stat
+import sys
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime
+from operator import itemgetter
+
+# Optional faster JSON backends (pip install orjson or ujson); the standard json module is used otherwise.
+try:
+    import orjson as _json_fast
+except ImportError:
+    try:
+        import ujson as _json_fast
+    except ImportError:
+        _json_fast = None
 
 RANDSTAD_ASCII = """
 \033[34m____ ____ _  _ ___  ____ ___ ____ ___     ___ ____ ____ ___ \033[0m
@@ -9,110 +23,388 @@ RANDSTAD_ASCII = """
 \033[34m|  \ |  | | \| |__/ ___]  |  |  | |__/     |  |___ ___]  |   \033[0m                                                          
 """
 
+C_RED = "\033[31m"
+C_GREEN = "\033[32m"
+C_YELLOW = "\033[33m"
+C_BLUE = "\033[34m"
+C_BOLD = "\033[1m"
+C_RESET = "\033[0m"
+
 FILE_NAME = "tasks.json"
+BUFFER_SIZE = 64 * 1024
+NO_TIMESTAMP = '0000-00-00 00:00'
+PRETTY_JSON = os.environ.get('TASKS_PRETTY') == '1'
+
+_cache = None
+_cache_sig = None
+_cache_next_id = None
+_cache_positions = None
+
+
+def _now_str():
+    """
+    Formats the current time as 'YYYY-MM-DD HH:MM' without going through strftime.
+    :return: Current timestamp string.
+    """
+    d = datetime.now()
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}"
+
+
+def make_task(title, desc, tags=None):
+    """
+    Builds a new task. Tasks are plain dictionaries, stored in the JSON file as they are.
+    :param title: Title of the task.
+    :param desc: Description of the task.
+    :param tags: List of strings.
+    :return: Dictionary with the task fields.
+    """
+    return {
+        'id': None,
+        'title': title,
+        'desc': desc,
+        'status': 'todo',
+        'tags': tags if tags else [],
+        'created_at': _now_str(),
+        'started_at': None,
+        'finished_at': None,
+    }
+
+
+def _json_loads(raw):
+    """
+    Parses JSON with the fastest available backend.
+    :param raw: Bytes read from the tasks file.
+    :return: Parsed data.
+    """
+    if _json_fast is not None:
+        return _json_fast.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data, pretty=False):
+    """
+    Serializes data to JSON with the fastest available backend.
+    Pretty output always goes through the standard json module, so it is indented the same way
+    whichever backend is installed.
+    :param data: Data to serialize.
+    :param pretty: Indent the output to be readable.
+    :return: JSON encoded as bytes.
+    """
+    if pretty:
+        return json.dumps(data, indent=4).encode()
+    if _json_fast is not None and _json_fast.__name__ == 'orjson':
+        return _json_fast.dumps(data)
+    if _json_fast is not None:
+        return _json_fast.dumps(data).encode()
+    return json.dumps(data, separators=(',', ':')).encode()
+
+
+def _normalize_task(task):
+    """
+    Fills in the fields that older or hand written task records may miss.
+    :param task: Task dictionary read from the file.
+    :return: The same dictionary, completed.
+    """
+    task.setdefault('id', None)
+    task.setdefault('status', 'todo')
+    task['tags'] = task.get('tags') or []
+    task.setdefault('created_at', None)
+    task.setdefault('started_at', None)
+    task.setdefault('finished_at', None)
+    return task
+
+
+def _copy_tasks(tasks):
+    """
+    Copies the tasks, so changes made by a caller don't reach the in-memory cache.
+    :param tasks: List of tasks.
+    :return: New list with copies of the tasks.
+    """
+    return [{**task, 'tags': list(task.get('tags') or [])} for task in tasks]
+
+
+def _file_signature():
+    """
+    Identifies the current version of the tasks file (name, modification time and size).
+    :return: Tuple used to validate the in-memory cache.
+    """
+    st = os.stat(FILE_NAME)
+    return FILE_NAME, st.st_mtime_ns, st.st_size
+
+
+def _invalidate_cache():
+    """
+    Drops the in-memory copy of the tasks, so the next load reads the file again.
+    """
+    global _cache, _cache_sig, _cache_next_id, _cache_positions
+    _cache = None
+    _cache_sig = None
+    _cache_next_id = None
+    _cache_positions = None
+_cache_positions = None
+
+
+def _next_id(tasks):
+    """
+    Returns the ID for the next created task. Falls back to the highest ID when the file didn't store it.
+    :param tasks: List of tasks.
+    :return: Next free task ID (int).
+    """
+    if _cache_next_id is not None:
+        return _cache_next_id
+    return max((task['id'] for task in tasks if task['id'] is not None), default=0) + 1
+
+
+def _scan_ids(tasks):
+    """
+    Walks the tasks once to map each ID to the position of its first task and to find the highest ID.
+    :param tasks: List of tasks.
+    :return: Tuple (dictionary with task IDs as keys and positions as values, highest ID).
+    """
+    positions = {}
+    max_id = 0
+    for position, task in enumerate(tasks):
+        task_id = task.get('id')
+        positions.setdefault(task_id, position)
+        if task_id is not None and task_id > max_id:
+            max_id = task_id
+    return positions, max_id
 
 
-class Task:
-    def __init__(self, title, desc, tags=None):
-        self.id = None
-        self.title = title
-        self.desc = desc
-        self.status = "todo"
-        self.tags = tags if tags else []
-        self.created_at = datetime.now().strftime('%Y-%m-%d %H:%M')
-        self.started_at = None
-        self.finished_at = None
+def _find_task(tasks, task_id):
+    """
+    Finds a task by its ID. Lists handed out by load_tasks keep the cached order,
+    so the cached positions give the task directly; otherwise the list is scanned.
+    :param tasks: List of tasks.
+    :param task_id: ID of the task.
+    :return: The task dictionary, or None if there is no task with that ID.
+    """
+    position = _cache_positions.get(task_id) if _cache_positions is not None else None
+    if position is not None and position < len(tasks) and tasks[position]['id'] == task_id:
+        return tasks[position]
+    return next((task for task in tasks if task['id'] == task_id), None)
 
 
 def load_tasks():
     """
     Creates file to store tasks. The try and except was added to look for file format error and permission error.
-    :return: List with task objects.
+    The tasks are kept in memory and the file is read again only when it changed on disk.
+    Files that store only the list of tasks (older format) are still accepted.
+    :return: List with tasks (dictionaries).
     """
-    if not os.path.exists(FILE_NAME):
-        return []
+    global _cache, _cache_sig, _cache_next_id, _cache_positions
 
     try:
-        with open(FILE_NAME, "r") as file:
-            tasks_data = json.load(file)
-
-        tasks = []
-        for task_data in tasks_data:
-            task_obj = Task(task_data['title'], task_data['desc'], task_data.get('tags'))
-            task_obj.id = task_data.get('id')
-            task_obj.status = task_data.get('status', 'todo')
-            task_obj.created_at = task_data.get('created_at')
-            task_obj.started_at = task_data.get('started_at')
-            task_obj.finished_at = task_data.get('finished_at')
-            tasks.append(task_obj)
-
-        return tasks
-
-    except json.JSONDecodeError:
-        print("\033[31mError: Invalid JSON format in the file.\033[31m")
+        sig = _file_signature()
+        if sig == _cache_sig:
+            return _copy_tasks(_cache)
+
+        with open(FILE_NAME, "rb", buffering=BUFFER_SIZE) as file:
+            file_data = _json_loads(file.read())
+
+        if isinstance(file_data, list):
+            tasks_data, next_id = file_data, None
+        else:
+            tasks_data, next_id = file_data['tasks'], file_data.get('next_id')
+
+        for task in tasks_data:
+            _normalize_task(task)
+        positions, max_id = _scan_ids(tasks_data)
+
+        _cache = tasks_data
+        _cache_sig = sig
+        _cache_positions = positions
+        # A stored next_id is only trusted if it is above every ID in the file.
+        _cache_next_id = max(next_id or 1, max_id + 1)
+        return _copy_tasks(tasks_data)
+
+    except FileNotFoundError:
+        _invalidate_cache()
+        return []
+    except ValueError:
+        _invalidate_cache()
+        print(f"{C_RED}Error: Invalid JSON format in the file.{C_RESET}")
         return []
     except Exception as e:
-        print(f"\033[31mAn error occurred: {e}\033[31m")
+        _invalidate_cache()
+        print(f"{C_RED}An error occurred: {e}{C_RESET}")
         return []
 
 
+def _file_mode():
+    """
+    Returns the permissions for the saved tasks file: the ones it already has,
+    or the default ones for new files.
+    :return: Permission bits (int).
+    """
+    try:
+        return stat.S_IMODE(os.stat(FILE_NAME).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
 def save_tasks(tasks):
     """
-    Transforms and saves dictionaries to JSON formatted string.
-    :param tasks: List of task objects.
+    Saves the tasks to JSON formatted string, together with the next free task ID.
+    The file is written compact, unless TASKS_PRETTY=1 is set in the environment.
+    The JSON is written in one go to a temporary file, which then replaces the tasks file.
+    :param tasks: List of tasks.
     :return: Writes to JSON file.
     """
-    task_dicts = []
-
-    for task in tasks:
-        task_dict = task.__dict__
-        task_dicts.append(task_dict)
+    global _cache, _cache_sig, _cache_next_id, _cache_positions
+    cached_next_id = _cache_next_id
+    _invalidate_cache()
+    tmp_file_name = None
 
     try:
-        with open(FILE_NAME, "w") as file:
-            json.dump(task_dicts, file, indent=4)
-    except json.JSONEncodeError:
-        print("\033[31mError: Failed to convert tasks to JSON format.\033[31m")
+        # The list is walked anyway to serialize it, so make sure next_id is above every stored ID.
+        positions, max_id = _scan_ids(tasks)
+        next_id = max(cached_next_id or 1, max_id + 1)
+        file_data = {"next_id": next_id, "tasks": tasks}
+        payload = _json_dumps(file_data, PRETTY_JSON)
+        cached_tasks = _copy_tasks(tasks)
+
+        # A unique temporary file per save, so concurrent runs don't write to or delete each other's file.
+        fd, tmp_file_name = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(FILE_NAME)), suffix=".tmp")
+        with os.fdopen(fd, "wb", buffering=BUFFER_SIZE) as file:
+            file.write(payload)
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(tmp_file_name, _file_mode())
+        os.replace(tmp_file_name, FILE_NAME)
+
+        _cache = cached_tasks
+        _cache_sig = _file_signature()
+        _cache_next_id = next_id
+        _cache_positions = positions
+    except (TypeError, ValueError):
+        print(f"{C_RED}Error: Failed to convert tasks to JSON format.{C_RESET}")
     except IOError:
-        print(f"\033[31mError: Unable to write to file {FILE_NAME}.\033[31m")
+        print(f"{C_RED}Error: Unable to write to file {FILE_NAME}.{C_RESET}")
     except Exception as e:
-        print(f"\033[31mAn unexpected error occurred: {e}\033[31m")
+        print(f"{C_RED}An unexpected error occurred: {e}{C_RESET}")
+    finally:
+        if tmp_file_name and os.path.exists(tmp_file_name):
+            os.remove(tmp_file_name)
+
+
+@contextmanager
+def tasks_session():
+    """
+    Loads the tasks once, lets the caller change them and saves them once on exit.
+    Useful when a script does several changes in a row. Nothing is saved if the tasks didn't change
+    or if the block raised an error.
+    :return: Yields the list of tasks.
+    """
+    tasks = load_tasks()
+    original_tasks = _copy_tasks(tasks)
+    try:
+        yield tasks
+    except BaseException:
+        _invalidate_cache()
+        raise
+
+    if tasks != original_tasks:
+        save_tasks(tasks)
+
+
+def _add_task(tasks, title, desc, tags):
+    """
+    Creates a new task with the next free ID and appends it to the loaded tasks.
+    :param tasks: List of tasks.
+    :return: The created task.
+    """
+    global _cache_next_id
+    task = make_task(title, desc, tags)
+    task['id'] = _next_id(tasks)
+    tasks.append(task)
+    _cache_next_id = task['id'] + 1
+    return task
+
+
+def _remove_task(tasks, task_id):
+    """
+    Removes a task from the loaded tasks.
+    :param tasks: List of tasks.
+    :param task_id: ID of the task to delete.
+    :return: True if the task was found and removed.
+    """
+    remaining_tasks = [task for task in tasks if task['id'] != task_id]
+    if len(remaining_tasks) == len(tasks):
+        return False
+    tasks[:] = remaining_tasks
+    return True
+
+
+def _apply_status(task, status):
+    """
+    Moves a task to in_progress (start) or done (finish) and sets the matching timestamp.
+    :param task: Task dictionary.
+    :param status: Options of the status: start, finish
+    :return: True if the task changed.
+    """
+    if status == 'start' and task['status'] != 'in_progress':
+        task['status'] = 'in_progress'
+        task['started_at'] = _now_str()
+    elif status == 'finish' and task['status'] != 'done':
+        task['status'] = 'done'
+        task['finished_at'] = _now_str()
+    else:
+        return False
+    return True
+
+
+def _apply_update(task, title=None, desc=None):
+    """
+    Sets a new title and/or description on a task.
+    :param task: Task dictionary.
+    :return: True if the task changed.
+    """
+    changed = False
+    if title and task['title'] != title:
+        task['title'] = title
+        changed = True
+    if desc and task['desc'] != desc:
+        task['desc'] = desc
+        changed = True
+    return changed
 
 
 def new_task(title, desc, tags):
     """
-    Creates a new object task and saves it to the JSON file.
+    Creates a new task and saves it to the JSON file.
     :param title: Title of the task.
     :param desc: Description of the task.
     :param tags: List of strings.
     """
     tasks = load_tasks()
-    if tasks:
-        highest_id = max(task.id for task in tasks)
-    else:
-        highest_id = 0
-
-    task = Task(title, desc, tags)
-    task.id = highest_id + 1
-    tasks.append(task)
+    _add_task(tasks, title, desc, tags)
     save_tasks(tasks)
 
 
+def _view_task_unchecked(task_id, tasks):
+    """
+    Looks up a task without validating the ID (the CLI already parses it as a positive int).
+    :param task_id: ID of a task.
+    :param tasks: List of tasks.
+    :return: Returns the dictionary for task ID.
+    """
+    return _find_task(tasks, task_id)
+
+
 def view_task(task_id):
     """
     Shows details of a task.
     :param task_id: ID of a task (positive int).
-    :return: Returns the dictionary for task ID (__dict__ attribute of instance).
+    :return: Returns the dictionary for task ID.
     """
     if not isinstance(task_id, int) or task_id <= 0:
-        print("\033[31mError: Invalid task ID provided. Please provide a positive integer.\033[31m")
+        print(f"{C_RED}Error: Invalid task ID provided. Please provide a positive integer.{C_RESET}")
         return None
 
-    tasks = load_tasks()
-    for task in tasks:
-        if task.id == task_id:
-            return vars(task)
-    return None
+    return _view_task_unchecked(task_id, load_tasks())
 
 
 def delete_task(task_id):
@@ -122,18 +414,35 @@ def delete_task(task_id):
     """
     tasks = load_tasks()
 
-    task_to_delete = None
-    for task in tasks:
-        if task.id == task_id:
-            task_to_delete = task
-            break
-
-    if task_to_delete:
-        tasks.remove(task_to_delete)
+    if _remove_task(tasks, task_id):
         save_tasks(tasks)
-        print(f"\033[32mTask with ID {task_id} deleted successfully.\033[32m")
+        print(f"{C_GREEN}Task with ID {task_id} deleted successfully.{C_RESET}")
     else:
-        print(f"\033[33mTask with ID {task_id} not found.\033[33m")
+        print(f"{C_YELLOW}Task with ID {task_id} not found.{C_RESET}")
+
+
+def _update_status_unchecked(task_id, status, tasks):
+    """
+    Updates the status of a task without validating the ID (the CLI already parses it as a positive int).
+    :param task_id: ID of the task we want to change the status.
+    :param status: Options of the status: start, finish
+    :param tasks: List of tasks.
+    :return: True if the task was found, False otherwise.
+    """
+    try:
+        task = _find_task(tasks, task_id)
+        if task is None:
+            return False
+
+        if _apply_status(task, status):
+            save_tasks(tasks)
+        return True
+    except (KeyError, TypeError):
+        print(f"{C_RED}Error: Malformed task data for task ID {task_id}.{C_RESET}")
+        return False
+    except Exception as e:
+        print(f"{C_RED}An unexpected error occurred: {e}{C_RESET}")
+        return False
 
 
 def update_status(task_id, status):
@@ -144,56 +453,30 @@ def update_status(task_id, status):
     :return:
     """
     if not isinstance(task_id, int) or task_id <= 0:
-        print("\033[31mError: Invalid task ID provided. Please provide a positive integer.\033[31m")
+        print(f"{C_RED}Error: Invalid task ID provided. Please provide a positive integer.{C_RESET}")
         return None
 
-    try:
-        tasks = load_tasks()
-        for task in tasks:
-            if task.id == task_id:
-                if status == 'start':
-                    task.status = 'in_progress'
-                    task.started_at = datetime.now().strftime('%Y-%m-%d %H:%M')
-                elif status == 'finish':
-                    task.status = 'done'
-                    task.finished_at = datetime.now().strftime('%Y-%m-%d %H:%M')
-                save_tasks(tasks)
-                return True
-        return False
-    except AttributeError:
-        print(f"\033[31mError: Malformed task data for task ID {task_id}.\033[31m")
-        return False
-    except Exception as e:
-        print(f"\033[31mAn unexpected error occurred: {e} \033[31m")
-        return False
+    return _update_status_unchecked(task_id, status, load_tasks())
 
 
 def update_task(task_id, title=None, desc=None):
     """
-    Updates the title and/or description of a task.
+    Updates the title and/or description of a task. The file is only rewritten if something changed.
     :param task_id: ID (int) of the task to be updated.
     :param title: New title for the task. (optional)
     :param desc: New description for the task. (optional)
     """
     tasks = load_tasks()
-    task_found = False
-
-    for task in tasks:
-        if task.id == task_id:
-            task_found = True
-            if title:
-                task.title = title
-            if desc:
-                task.desc = desc
-            break
+    task = _find_task(tasks, task_id)
 
-    if not task_found:
-        raise ValueError(f"\033[33mNo task found with ID {task_id}\033[33m")
+    if task is None:
+        raise ValueError(f"{C_YELLOW}No task found with ID {task_id}{C_RESET}")
 
-    save_tasks(tasks)
+    if _apply_update(task, title, desc):
+        save_tasks(tasks)
 
 
-def list_tasks(status=None, tag=None, sort=None, search=None):
+def list_tasks(status=None, tag=None, sort=None, search=None, ignore_case=False):
     """
     Function returns the tasks that have a specific status or tag.
     Tasks can e also sorted by creation, started or finished time.
@@ -203,48 +486,56 @@ def list_tasks(status=None, tag=None, sort=None, search=None):
     :param tag: List of strings.
     :param sort: Options for sort: 'created_at', 'started_at', 'finished_at'.
     :param search: Will search the given string in the title or description of the task.
+    :param ignore_case: Search without taking upper/lower case into account.
     :returns: A list with tasks.
     """
     tasks = load_tasks()
 
-    if status:
-        filtered_tasks = []
-        for task in tasks:
-            if task.status == status:
-                filtered_tasks.append(task)
-        tasks = filtered_tasks
-
-    if tag:
-        filtered_tasks = []
-        for task in tasks:
-            if tag in task.tags:
-                filtered_tasks.append(task)
-        tasks = filtered_tasks
-
-    if search:
-        filtered_tasks = []
-        for task in tasks:
-            if search in task.title or search in task.desc:
-                filtered_tasks.append(task)
-        tasks = filtered_tasks
+    # Single pass over the tasks; filters that weren't given are skipped by the first check of each condition.
+    if search and ignore_case:
+        # The pattern is compiled once, so no lowercase copies are made per task.
+        find = re.compile(re.escape(search), re.IGNORECASE).search
+        tasks = [
+            task for task in tasks
+            if (not status or task['status'] == status)
+            and (not tag or tag in task['tags'])
+            and (find(task['title']) or find(task['desc']))
+        ]
+    elif status or tag or search:
+        tasks = [
+            task for task in tasks
+            if (not status or task['status'] == status)
+            and (not tag or tag in task['tags'])
+            and (not search or search in task['title'] or search in task['desc'])
+        ]
 
     if sort:
-        def sort_key(task):
-            value = getattr(task, sort)
-            if value is None and sort in ['created_at', 'started_at', 'finished_at']:
-                return '0000-00-00 00:00'
-            return value
+        getter = itemgetter(sort)
+        tasks.sort(key=lambda task: getter(task) or NO_TIMESTAMP)
 
-        tasks.sort(key=sort_key)
+    return tasks
 
-    result = []
-    for task in tasks:
-        result.append(vars(task))
 
-    return result
+def positive_int(value):
+    """
+    Argument type for task IDs on the command line.
+    :param value: String given on the command line.
+    :return: The value as a positive int.
+    """
+    import argparse
+
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError("Invalid task ID provided. Please provide a positive integer.")
+    return number
 
 
 def full_help(parser):
+    import argparse
+
     parser.print_help()
     subparsers_actions = [
         action for action in parser._actions
@@ -253,12 +544,15 @@ def full_help(parser):
 
     for subparsers_action in subparsers_actions:
         for choice, subparser in subparsers_action.choices.items():
-            print("\033[34m\nCommand '{}'\033[34m".format(choice))
-            print("\033[33m-\033[33m" * len("Command '{}'".format(choice)))
+            heading = f"Command '{choice}'"
+            print(f"{C_BLUE}\n{heading}{C_RESET}")
+            print(f"{C_YELLOW}{'-' * len(heading)}{C_RESET}")
             subparser.print_help()
 
 
 def main():
+    import argparse
+
     print(RANDSTAD_ASCII)
     parser = argparse.ArgumentParser(description=" ***** CLI Task Manager ***** ", add_help=False)
 
@@ -273,15 +567,15 @@ def main():
                                  help="List of tags for the task, separated by spaces")
 
     task_parser = subparsers.add_parser('task')
-    task_parser.add_argument('id', type=int, help="ID of the task to interact with")
+    task_parser.add_argument('id', type=positive_int, help="ID of the task to interact with")
     task_parser.add_argument('action', choices=['start', 'finish', 'view'], default='view',
                              help="Action to perform on the task: start, finish, or view")
 
     delete_task_parser = subparsers.add_parser('delete')
-    delete_task_parser.add_argument('id', type=int, help="ID of the task to delete")
+    delete_task_parser.add_argument('id', type=positive_int, help="ID of the task to delete")
 
     update_task_parser = subparsers.add_parser('update_task')
-    update_task_parser.add_argument('id', type=int, help="ID of the task to update title and description")
+    update_task_parser.add_argument('id', type=positive_int, help="ID of the task to update title and description")
     update_task_parser.add_argument('--title', help="New title for the task")
     update_task_parser.add_argument('--desc', help="New description for the task")
 
@@ -292,17 +586,17 @@ def main():
     list_tasks_parser.add_argument('--sort', choices=['created_at', 'started_at', 'finished_at'],
                                    help="Sort tasks by their timestamps: created_at, started_at, or finished_at")
     list_tasks_parser.add_argument('--search', help="Search tasks by a keyword in their title or description")
+    list_tasks_parser.add_argument('--ignore-case', action='store_true',
+                                   help="Search without taking upper/lower case into account")
 
-    args, unknown = parser.parse_known_args()
+    args = parser.parse_args()
 
     if args.help:
         full_help(parser)
         return
 
-    args = parser.parse_args()
-
     if args.command is None:
-        response = input("\033[1mNo parameters provided. Do you need help? (yes/no): \033[1m").lower().strip()
+        response = input(f"{C_BOLD}No parameters provided. Do you need help? (yes/no): {C_RESET}").lower().strip()
         if response == 'yes':
             full_help(parser)
             return
@@ -311,9 +605,9 @@ def main():
         new_task(args.title, args.desc, args.tags)
     elif args.command == 'task':
         if args.action == 'view':
-            print(json.dumps(view_task(args.id), indent=4))
+            print(json.dumps(_view_task_unchecked(args.id, load_tasks()), indent=4))
         else:
-            update_status(args.id, args.action)
+            _update_status_unchecked(args.id, args.action, load_tasks())
     elif args.command == 'delete':
         delete_task(args.id)
     elif args.command == 'update_task':
@@ -322,9 +616,8 @@ def main():
         except ValueError as e:
             print(e)
     elif args.command == 'tasks':
-        tasks = list_tasks(args.status, args.tag, args.sort, args.search)
-        for task in tasks:
-            print(json.dumps(task, indent=4))
+        tasks = list_tasks(args.status, args.tag, args.sort, args.search, args.ignore_case)
+        sys.stdout.write(json.dumps(tasks, indent=4) + "\n")
 
 
 if __name__ == "__main__":
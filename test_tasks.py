@@ -1,6 +1,7 @@
 import unittest
 import os
-from tasks import new_task, load_tasks, delete_task, update_status
+from tasks import (new_task, load_tasks, save_tasks, delete_task, update_status, update_task, view_task, list_tasks,
+                   tasks_session, _invalidate_cache)
 from unittest.mock import patch
 
 
@@ -12,6 +13,7 @@ class TestTasks(unittest.TestCase):
     def setUp(self):
         if os.path.exists(TEST_FILE_NAME):
             os.remove(TEST_FILE_NAME)
+        _invalidate_cache()
 
     @patch('tasks.FILE_NAME', TEST_FILE_NAME)
     def test_new_task_creation(self):
@@ -21,10 +23,10 @@ class TestTasks(unittest.TestCase):
 
         self.assertEqual(len(tasks), 1)
 
-        self.assertEqual(tasks[0].title, "Test title")
-        self.assertEqual(tasks[0].desc, "This is a test desc.")
-        self.assertEqual(tasks[0].tags, ["test_tag"])
-        self.assertEqual(tasks[0].status, "todo")
+        self.assertEqual(tasks[0]['title'], "Test title")
+        self.assertEqual(tasks[0]['desc'], "This is a test desc.")
+        self.assertEqual(tasks[0]['tags'], ["test_tag"])
+        self.assertEqual(tasks[0]['status'], "todo")
 
     @patch('tasks.FILE_NAME', TEST_FILE_NAME)
     def test_task_deletion(self):
@@ -41,13 +43,192 @@ class TestTasks(unittest.TestCase):
 
         tasks_before_update = load_tasks()
         self.assertEqual(len(tasks_before_update), 1)
-        self.assertEqual(tasks_before_update[0].status, "todo")
+        self.assertEqual(tasks_before_update[0]['status'], "todo")
 
         update_status(1, "start")
 
         tasks_after_update = load_tasks()
         self.assertEqual(len(tasks_after_update), 1)
-        self.assertEqual(tasks_after_update[0].status, "in_progress")
+        self.assertEqual(tasks_after_update[0]['status'], "in_progress")
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    def test_load_tasks_reloads_changed_file(self):
+        new_task("Cached task", "desc.", ["tag_1"])
+        self.assertEqual(len(load_tasks()), 1)
+
+        with open(TEST_FILE_NAME, "w") as file:
+            file.write("[]")
+
+        self.assertEqual(len(load_tasks()), 0)
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    def test_changing_loaded_task_does_not_change_cache(self):
+        new_task("Cached task", "desc.", ["tag_1"])
+
+        view_task(1)['status'] = "done"
+        list_tasks()[0]['tags'].append("tag_2")
+
+        task = load_tasks()[0]
+        self.assertEqual(task['status'], "todo")
+        self.assertEqual(task['tags'], ["tag_1"])
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    def test_new_task_does_not_reuse_deleted_id(self):
+        with open(TEST_FILE_NAME, "w") as file:
+            file.write('[{"id": 1, "title": "Old format", "desc": "desc.", "tags": []}]')
+
+        new_task("Second task", "desc.", [])
+        delete_task(2)
+        new_task("Third task", "desc.", [])
+
+        tasks = load_tasks()
+        self.assertEqual([task['id'] for task in tasks], [1, 3])
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    def test_list_tasks_filter_and_sort(self):
+        new_task("First task", "desc.", ["tag_1"])
+        new_task("Second task", "desc.", ["tag_1"])
+        new_task("Third task", "other.", ["tag_2"])
+        update_status(2, "start")
+
+        tasks = list_tasks(tag="tag_1", sort="started_at")
+        self.assertEqual([task['id'] for task in tasks], [1, 2])
+
+        tasks = list_tasks(status="todo", search="other")
+        self.assertEqual([task['id'] for task in tasks], [3])
+
+        self.assertEqual(list_tasks(search="THIRD"), [])
+        tasks = list_tasks(search="THIRD", ignore_case=True)
+        self.assertEqual([task['id'] for task in tasks], [3])
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    def test_unchanged_task_is_not_saved(self):
+        new_task("Test no-op update", "desc.", ["tag_1"])
+        update_status(1, "start")
+
+        with patch('tasks.save_tasks') as save_tasks_mock:
+            update_status(1, "start")
+            update_task(1, "Test no-op update", None)
+
+        save_tasks_mock.assert_not_called()
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    def test_tasks_session_saves_once(self):
+        new_task("Session task", "desc.", ["tag_1"])
+
+        with patch('tasks.save_tasks', wraps=save_tasks) as save_tasks_mock:
+            with tasks_session() as tasks:
+                tasks[0]['title'] = "Renamed in session"
+                tasks[0]['tags'].append("tag_2")
+
+        save_tasks_mock.assert_called_once()
+        self.assertEqual(load_tasks()[0]['title'], "Renamed in session")
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    def test_load_tasks_fills_missing_fields(self):
+        with open(TEST_FILE_NAME, "w") as file:
+            file.write('[{"id": 1, "title": "Legacy task", "desc": "desc.", "tags": null}]')
+
+        task = load_tasks()[0]
+        self.assertEqual(task['status'], "todo")
+        self.assertEqual(task['tags'], [])
+        self.assertIsNone(task['created_at'])
+
+        self.assertEqual(list_tasks(status="todo", tag="tag_1", sort="created_at"), [])
+        self.assertEqual(len(list_tasks(sort="created_at")), 1)
+        self.assertTrue(update_status(1, "start"))
+        self.assertEqual(load_tasks()[0]['status'], "in_progress")
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    def test_tasks_session_without_changes_or_with_error_does_not_save(self):
+        new_task("Session task", "desc.", ["tag_1"])
+
+        with patch('tasks.save_tasks') as save_tasks_mock:
+            with tasks_session():
+                pass
+            with self.assertRaises(RuntimeError):
+                with tasks_session() as tasks:
+                    tasks[0]['title'] = "Renamed in session"
+                    raise RuntimeError
+
+        save_tasks_mock.assert_not_called()
+        self.assertEqual(load_tasks()[0]['title'], "Session task")
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    def test_save_tasks_keeps_next_id_above_saved_ids(self):
+        new_task("First task", "desc.", [])
+        tasks = load_tasks()
+        tasks.append({**tasks[0], 'id': 2, 'title': "Added directly"})
+        save_tasks(tasks)
+
+        new_task("Third task", "desc.", [])
+        self.assertEqual([task['id'] for task in load_tasks()], [1, 2, 3])
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    @patch('tasks._json_fast', None)
+    def test_standard_json_fallback(self):
+        new_task("Fallback task", "desc.", ["tag_1"])
+        update_status(1, "start")
+
+        with open(TEST_FILE_NAME) as file:
+            self.assertTrue(file.read().startswith('{"next_id":2,"tasks":[{'))
+
+        _invalidate_cache()
+        self.assertEqual(load_tasks()[0]['status'], "in_progress")
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    @patch('tasks.PRETTY_JSON', True)
+    def test_pretty_json_is_indented_by_four(self):
+        new_task("Pretty task", "desc.", [])
+
+        with open(TEST_FILE_NAME) as file:
+            self.assertIn('\n    "next_id": 2', file.read())
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    def test_stored_next_id_below_existing_ids_is_ignored(self):
+        with open(TEST_FILE_NAME, "w") as file:
+            file.write('{"next_id": 1, "tasks": [{"id": 1, "title": "Stored task", "desc": "desc."}]}')
+
+        new_task("Second task", "desc.", [])
+        self.assertEqual([task['id'] for task in load_tasks()], [1, 2])
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    def test_tasks_without_id_are_loaded_and_saved(self):
+        with open(TEST_FILE_NAME, "w") as file:
+            file.write('[{"title": "No id", "desc": "desc."}]')
+
+        self.assertEqual(len(list_tasks()), 1)
+        save_tasks(load_tasks())
+        new_task("Second task", "desc.", [])
+        self.assertEqual([task['id'] for task in load_tasks()], [None, 1])
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    def test_save_tasks_without_tags_keeps_cache(self):
+        save_tasks([{'id': 1, 'title': "No tags", 'desc': "desc.", 'status': "todo"}])
+
+        self.assertEqual(load_tasks()[0]['tags'], [])
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    def test_save_tasks_keeps_file_permissions(self):
+        new_task("Permissions task", "desc.", [])
+        os.chmod(TEST_FILE_NAME, 0o600)
+
+        update_status(1, "start")
+
+        self.assertEqual(os.stat(TEST_FILE_NAME).st_mode & 0o777, 0o600)
+        self.assertEqual([name for name in os.listdir(".") if name.endswith(".tmp")], [])
+
+    @patch('tasks.FILE_NAME', TEST_FILE_NAME)
+    def test_view_task_returns_first_task_with_id(self):
+        with open(TEST_FILE_NAME, "w") as file:
+            file.write('[{"id": 1, "title": "First", "desc": "desc."}, {"id": 2, "title": "Second", "desc": "desc."},'
+                       ' {"id": 2, "title": "Duplicate", "desc": "desc."}]')
+
+        self.assertEqual(view_task(2)['title'], "Second")
+        self.assertIsNone(view_task(3))
+
+        delete_task(1)
+        self.assertEqual(view_task(2)['title'], "Second")
 
     def tearDown(self):
         if os.path.exists(TEST_FILE_NAME):